@@ -110,6 +110,14 @@ def main(
         logging.critical(f"You are running fake with {mode} mode")
         sys.exit(1)
 
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+
+        uvloop.install()
+        logging.info("Using uvloop as the event loop")
+    except ImportError:
+        logging.info("uvloop not available, using the default event loop")
+
     if mode == Mode.PAST:
         from tgcf.past import forward_job  # pylint: disable=import-outside-toplevel
 
@@ -1,10 +1,12 @@
 """Load all user defined config and env vars."""
 
+import asyncio
 import logging
 import os
 import sys
 from typing import Dict, List, Optional, Union, Any
 
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel, validator  # pylint: disable=no-name-in-module
 from pymongo import MongoClient
@@ -129,8 +131,8 @@ def read_config(count=1) -> Config:
         logging.info(f"Trying to read config time:{count}")
     try:
         if stg.CONFIG_TYPE == 1:
-            with open(CONFIG_FILE_NAME, encoding="utf8") as file:
-                return Config.parse_raw(file.read())
+            with open(CONFIG_FILE_NAME, "rb") as file:
+                return Config.parse_obj(orjson.loads(file.read()))
         elif stg.CONFIG_TYPE == 2:
             return read_db()
         else:
@@ -161,8 +163,18 @@ def get_env_var(name: str, optional: bool = False) -> str:
     return var
 
 
+# identifier (username/link/phone) to chat id mapping, to avoid
+# resolving the same peer over the network again and again
+_ENT_CACHE: Dict[str, int] = {}
+
+
 async def get_id(client: TelegramClient, peer):
-    return await client.get_peer_id(peer)
+    key = str(peer)
+    if key in _ENT_CACHE:
+        return _ENT_CACHE[key]
+    resolved = await client.get_peer_id(peer)
+    _ENT_CACHE[key] = resolved
+    return resolved
 
 
 async def load_from_to(
@@ -186,17 +198,57 @@ async def load_from_to(
     """
     from_to_dict = {}
 
-    async def _(peer):
-        return await get_id(client, peer)
-
+    active_forwards = []
+    peers = {}
     for forward in forwards:
         if not forward.use_this:
             continue
         source = forward.source
         if not isinstance(source, int) and source.strip() == "":
             continue
-        src = await _(forward.source)
-        from_to_dict[src] = [await _(dest) for dest in forward.dest]
+        active_forwards.append(forward)
+        for peer in [forward.source, *forward.dest]:
+            peers.setdefault(str(peer), peer)
+
+    ids = await asyncio.gather(*(get_id(client, peer) for peer in peers.values()))
+    resolved = dict(zip(peers.keys(), ids))
+
+    for forward in active_forwards:
+        src = resolved[str(forward.source)]
+        # dedupe while preserving order; aliases of the same chat would
+        # otherwise fan out duplicate sends
+        from_to_dict[src] = list(
+            dict.fromkeys(resolved[str(dest)] for dest in forward.dest)
+        )
+
+    all_dests = {dest for dests in from_to_dict.values() for dest in dests}
+
+    async def resolve_input_entity(dest):
+        try:
+            return await client.get_input_entity(dest)
+        except ValueError:
+            # the cached id is unknown to this session: invalidate it and
+            # re-resolve from the original identifier, which also teaches
+            # the session about the entity
+            originals = [peers[key] for key, rid in resolved.items() if rid == dest]
+            for key, rid in list(_ENT_CACHE.items()):
+                if rid == dest:
+                    del _ENT_CACHE[key]
+            if not originals:
+                raise
+            await get_id(client, originals[0])
+            return await client.get_input_entity(dest)
+
+    inputs = await asyncio.gather(
+        *(resolve_input_entity(dest) for dest in all_dests),
+        return_exceptions=True,
+    )
+    dest_inputs.clear()
+    for dest, input_entity in zip(all_dests, inputs):
+        if isinstance(input_entity, Exception):
+            logging.warning(f"Could not get input entity for {dest}")
+            continue
+        dest_inputs[dest] = input_entity
     logging.info(f"From to dict is {from_to_dict}")
     return from_to_dict
 
@@ -243,6 +295,8 @@ if PASSWORD == "tgcf":
         "You have not set a password to protect the web access to tgcf.\nThe default password `tgcf` is used."
     )
 from_to = {}
+# chat id -> pre-resolved InputPeer, so sends skip entity lookups
+dest_inputs: Dict[int, Any] = {}
 is_bot: Optional[bool] = None
 logging.info("config.py got executed")
 
@@ -11,6 +11,8 @@ REGISTER_COMMANDS = True
 
 KEEP_LAST_MANY = 10000
 
+ALBUM_DEBOUNCE = 1.0  # seconds to wait for all items of an album to arrive
+
 CONFIG_FILE_NAME = "tgcf.config.json"
 CONFIG_ENV_VAR_NAME = "TGCF_CONFIG"
 
@@ -1,9 +1,10 @@
 """The module responsible for operating tgcf in live mode."""
 
+import asyncio
 import logging
 import os
 import sys
-from typing import Union
+from typing import Dict, List, Tuple, Union
 
 from telethon import TelegramClient, events, functions, types
 from telethon.sessions import StringSession
@@ -14,18 +15,26 @@ from tgcf import storage as st
 from tgcf.bot import get_events
 from tgcf.config import CONFIG, get_SESSION
 from tgcf.plugins import apply_plugins, load_async_plugins
-from tgcf.utils import clean_session_files, send_message
+from tgcf.utils import clean_session_files, send_album, send_message
+
+# (chat id, grouped id) to the buffered album items and their flush timer
+_albums: Dict[Tuple[int, int], Tuple[List[Message], asyncio.TimerHandle]] = {}
 
 
 async def new_message_handler(event: Union[Message, events.NewMessage]) -> None:
     """Process new incoming messages."""
     chat_id = event.chat_id
 
-    if chat_id not in config.from_to:
+    dest = config.from_to.get(chat_id)
+    if dest is None:
         return
-    logging.info(f"New message received in {chat_id}")
+    logging.debug("New message received in %s", chat_id)
     message = event.message
 
+    if message.grouped_id:
+        await album_message_handler(event)
+        return
+
     event_uid = st.EventUid(event)
 
     length = len(st.stored)
@@ -36,8 +45,6 @@ async def new_message_handler(event: Union[Message, events.NewMessage]) -> None:
             del st.stored[key]
             break
 
-    dest = config.from_to.get(chat_id)
-
     tm = await apply_plugins(message)
     if not tm:
         return
@@ -47,24 +54,131 @@ async def new_message_handler(event: Union[Message, events.NewMessage]) -> None:
         r_event_uid = st.EventUid(r_event)
 
     st.stored[event_uid] = {}
-    for d in dest:
+
+    async def forward_to_dest(d: int) -> None:
+        reply_to = None
         if event.is_reply and r_event_uid in st.stored:
-            tm.reply_to = st.stored.get(r_event_uid).get(d)
-        fwded_msg = await send_message(d, tm)
+            reply_to = st.stored.get(r_event_uid).get(d)
+        fwded_msg = await send_message(d, tm, reply_to=reply_to)
         st.stored[event_uid].update({d: fwded_msg})
+
+    results = await asyncio.gather(
+        *(forward_to_dest(d) for d in dest), return_exceptions=True
+    )
+    for d, result in zip(dest, results):
+        if isinstance(result, Exception):
+            logging.error("Failed to forward message to %s. \n %s", d, result)
     tm.clear()
 
 
+async def album_message_handler(event) -> None:
+    """Buffer an album item till the whole album arrives, then forward it.
+
+    Telegram delivers every item of an album as a separate update. Items
+    sharing a (chat id, grouped id) key are buffered, and a flush is
+    scheduled out-of-band after a short debounce; every straggler pushes
+    the flush further out. The handler returns immediately, so dispatch
+    is never held up, even with sequential_updates turned on.
+    """
+    key = (event.chat_id, event.message.grouped_id)
+    loop = asyncio.get_running_loop()
+    if key in _albums:
+        messages, timer = _albums[key]
+        timer.cancel()
+        messages.append(event.message)
+    else:
+        messages = [event.message]
+    timer = loop.call_later(
+        const.ALBUM_DEBOUNCE, lambda: asyncio.create_task(flush_album(key))
+    )
+    _albums[key] = (messages, timer)
+
+
+async def flush_album(key: Tuple[int, int]) -> None:
+    """Forward a buffered album once its debounce window lapses."""
+    entry = _albums.pop(key, None)
+    if entry is None:
+        # a straggler re-armed the timer after the first one fired, so
+        # another flush task already handled this album
+        return
+    messages, _ = entry
+    messages.sort(key=lambda message: message.id)
+    await forward_album(key[0], messages)
+
+
+async def forward_album(chat_id: int, messages: List[Message]) -> None:
+    """Forward a complete album to all destinations of a source."""
+    dest = config.from_to.get(chat_id)
+    if not dest:
+        # the source was removed (e.g. via the bot's /remove command)
+        # while the album sat in the debounce buffer
+        return
+    tms = []
+    for message in messages:
+        tm = await apply_plugins(message)
+        if tm:
+            tms.append(tm)
+    if not tms:
+        return
+    client = tms[0].client
+    kept = [tm.message for tm in tms]
+    media = [tm.new_file or tm.message.media for tm in tms]
+    captions = [tm.text or "" for tm in tms]
+
+    async def forward_item(d: int, tm) -> None:
+        fwded = await send_album(
+            d, client, [tm.message], [tm.new_file or tm.message.media], [tm.text or ""]
+        )
+        store_album(d, [tm.message], fwded)
+
+    async def forward_to_dest(d: int) -> None:
+        try:
+            fwded_msgs = await send_album(d, client, kept, media, captions)
+        except Exception as err:
+            logging.warning("Failed to send album as a group to %s. \n %s", d, err)
+            results = await asyncio.gather(
+                *(forward_item(d, tm) for tm in tms),
+                return_exceptions=True,
+            )
+            for tm, result in zip(tms, results):
+                if isinstance(result, Exception):
+                    logging.error(
+                        "Failed to forward album item %s to %s. \n %s",
+                        tm.message.id,
+                        d,
+                        result,
+                    )
+        else:
+            store_album(d, kept, fwded_msgs)
+
+    results = await asyncio.gather(
+        *(forward_to_dest(d) for d in dest), return_exceptions=True
+    )
+    for d, result in zip(dest, results):
+        if isinstance(result, Exception):
+            logging.error("Failed to forward album to %s. \n %s", d, result)
+    for tm in tms:
+        tm.clear()
+
+
+def store_album(d: int, messages: List[Message], fwded_msgs: List[Message]) -> None:
+    """Remember sent album items, to keep edit and delete syncs working."""
+    for message, fwded in zip(messages, fwded_msgs):
+        event_uid = st.EventUid(st.DummyEvent(message.chat_id, message.id))
+        st.stored.setdefault(event_uid, {})[d] = fwded
+
+
 async def edited_message_handler(event) -> None:
     """Handle message edits."""
     message = event.message
 
     chat_id = event.chat_id
 
-    if chat_id not in config.from_to:
+    dest = config.from_to.get(chat_id)
+    if dest is None:
         return
 
-    logging.info(f"Message edited in {chat_id}")
+    logging.debug("Message edited in %s", chat_id)
 
     event_uid = st.EventUid(event)
 
@@ -84,10 +198,12 @@ async def edited_message_handler(event) -> None:
                 await msg.edit(tm.text)
         return
 
-    dest = config.from_to.get(chat_id)
-
-    for d in dest:
-        await send_message(d, tm)
+    results = await asyncio.gather(
+        *(send_message(d, tm) for d in dest), return_exceptions=True
+    )
+    for d, result in zip(dest, results):
+        if isinstance(result, Exception):
+            logging.error("Failed to forward message to %s. \n %s", d, result)
     tm.clear()
 
 
@@ -97,7 +213,7 @@ async def deleted_message_handler(event):
     if chat_id not in config.from_to:
         return
 
-    logging.info(f"Message deleted in {chat_id}")
+    logging.debug("Message deleted in %s", chat_id)
 
     event_uid = st.EventUid(event)
     fwded_msgs = st.stored.get(event_uid)
@@ -107,10 +223,19 @@ async def deleted_message_handler(event):
         return
 
 
+def _in_from_to(event) -> bool:
+    """Filter at dispatch: drop updates from chats tgcf does not watch.
+
+    Looks up config.from_to on every call, so forwards added at runtime
+    through the bot commands keep working.
+    """
+    return event.chat_id in config.from_to
+
+
 ALL_EVENTS = {
-    "new": (new_message_handler, events.NewMessage()),
-    "edited": (edited_message_handler, events.MessageEdited()),
-    "deleted": (deleted_message_handler, events.MessageDeleted()),
+    "new": (new_message_handler, events.NewMessage(func=_in_from_to)),
+    "edited": (edited_message_handler, events.MessageEdited(func=_in_from_to)),
+    "deleted": (deleted_message_handler, events.MessageDeleted(func=_in_from_to)),
 }
 
 
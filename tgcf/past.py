@@ -6,7 +6,6 @@
 
 import asyncio
 import logging
-import time
 
 from telethon import TelegramClient
 from telethon.errors.rpcerrorlist import FloodWaitError
@@ -72,14 +71,15 @@ async def forward_job() -> None:
                         st.stored[event_uid].update({d: fwded_msg.id})
                     tm.clear()
                     last_id = message.id
-                    logging.info(f"forwarding message with id = {last_id}")
+                    logging.info("forwarding message with id = %s", last_id)
                     forward.offset = last_id
-                    write_config(CONFIG, persist=False)
-                    time.sleep(CONFIG.past.delay)
-                    logging.info(f"slept for {CONFIG.past.delay} seconds")
+                    # config write is blocking file/db I/O; keep it off the loop
+                    await asyncio.to_thread(write_config, CONFIG, persist=False)
+                    await asyncio.sleep(CONFIG.past.delay)
+                    logging.debug("slept for %s seconds", CONFIG.past.delay)
 
                 except FloodWaitError as fwe:
-                    logging.info(f"Sleeping for {fwe}")
+                    logging.info("Sleeping for %s", fwe)
                     await asyncio.sleep(delay=fwe.seconds)
                 except Exception as err:
                     logging.exception(err)
@@ -20,6 +20,20 @@ PLUGINS = CONFIG.plugins
 
 
 class TgcfMessage:
+    __slots__ = (
+        "message",
+        "text",
+        "raw_text",
+        "sender_id",
+        "file_type",
+        "new_file",
+        "uploaded_file",
+        "cleanup",
+        "reply_to",
+        "client",
+        "file",
+    )
+
     def __init__(self, message: Message) -> None:
         self.message = message
         self.text = self.message.text
@@ -27,6 +41,7 @@ class TgcfMessage:
         self.sender_id = self.message.sender_id
         self.file_type = self.guess_file_type()
         self.new_file = None
+        self.uploaded_file = None
         self.cleanup = False
         self.reply_to = None
         self.client = self.message.client
@@ -50,6 +65,7 @@ class TgcfMessage:
         if self.new_file and self.cleanup:
             cleanup(self.new_file)
             self.new_file = None
+        self.uploaded_file = None
 
 
 class TgcfPlugin:
@@ -96,6 +112,8 @@ def load_plugins() -> Dict[str, TgcfPlugin]:
             if not plugin.id_ == plugin_id:
                 logging.error(f"Plugin id for {plugin_id} does not match expected id.")
                 continue
+            # decided once here, instead of on every message in apply_plugins
+            plugin.modify_is_async = inspect.iscoroutinefunction(plugin.modify)
         except AttributeError:
             logging.error(f"Found plugin {plugin_id}, but plugin class not found.")
         else:
@@ -119,14 +137,14 @@ async def apply_plugins(message: Message) -> TgcfMessage:
 
     for _id, plugin in plugins.items():
         try:
-            if inspect.iscoroutinefunction(plugin.modify):
+            if plugin.modify_is_async:
                 ntm = await plugin.modify(tm)
             else:
                 ntm = plugin.modify(tm)
         except Exception as err:
-            logging.error(f"Failed to apply plugin {_id}. \n {err} ")
+            logging.error("Failed to apply plugin %s. \n %s", _id, err)
         else:
-            logging.info(f"Applied plugin {_id}")
+            logging.debug("Applied plugin %s", _id)
             if not ntm:
                 tm.clear()
                 return None
@@ -7,6 +7,8 @@ from telethon.tl.custom.message import Message
 class EventUid:
     """The objects of this class uniquely identifies a message with its chat id and message id."""
 
+    __slots__ = ("chat_id", "msg_id")
+
     def __init__(self, event) -> None:
         self.chat_id = event.chat_id
         try:
@@ -25,6 +27,8 @@ class EventUid:
 
 
 class DummyEvent:
+    __slots__ = ("chat_id", "id")
+
     def __init__(self, chat_id, msg_id):
         self.chat_id = chat_id
         self.id = msg_id
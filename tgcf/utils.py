@@ -1,24 +1,60 @@
 """Utility functions to smoothen your life."""
 
+import asyncio
 import logging
 import os
 import platform
 import re
 import sys
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List
 
 from telethon.client import TelegramClient
+from telethon.errors import (
+    ChatForwardsRestrictedError,
+    FloodWaitError,
+    ServerError,
+    TimedOutError,
+)
 from telethon.hints import EntityLike
 from telethon.tl.custom.message import Message
 
-from tgcf import __version__
+from tgcf import __version__, config
 from tgcf.config import CONFIG
 from tgcf.plugin_models import STYLE_CODES
 
 if TYPE_CHECKING:
     from tgcf.plugins import TgcfMessage
 
+# Cap the number of in-flight outbound RPCs, so that concurrent fan-out
+# does not trip Telegram's rate limiter and cause FloodWaitError.
+SEND_SEM = asyncio.Semaphore(int(os.getenv("TGCF_SEND_CONCURRENCY", "20")))
+
+MAX_RETRIES = 5
+
+
+async def _retry(coro_fn, *args, **kwargs):
+    """Run a Telethon RPC, retrying on transient errors.
+
+    Sleeps out FloodWaitError, and backs off exponentially on server and
+    connection errors, so that rate-limiter hits do not drop messages.
+    Permanent RPC errors (restricted chats, missing rights, ...) are
+    raised immediately so callers can react to them.
+    """
+    for attempt in range(MAX_RETRIES):
+        try:
+            return await coro_fn(*args, **kwargs)
+        except FloodWaitError as fwe:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            logging.warning("FloodWaitError: sleeping for %s seconds.", fwe.seconds)
+            await asyncio.sleep(fwe.seconds + 1)
+        except (ServerError, TimedOutError, ConnectionError) as err:
+            if attempt == MAX_RETRIES - 1:
+                raise
+            logging.warning("Retrying after error: %s", err)
+            await asyncio.sleep(2**attempt)
+
 
 def platform_info():
     nl = "\n"
@@ -29,18 +65,77 @@ def platform_info():
     \n{platform.architecture()} {platform.processor()}"""
 
 
-async def send_message(recipient: EntityLike, tm: "TgcfMessage") -> Message:
-    """Forward or send a copy, depending on config."""
+async def send_message(
+    recipient: EntityLike, tm: "TgcfMessage", reply_to: Message = None
+) -> Message:
+    """Forward or send a copy, depending on config.
+
+    reply_to is taken as an argument, not read from tm, because concurrent
+    sends to several destinations share one TgcfMessage and each
+    destination replies to a different message.
+    """
     client: TelegramClient = tm.client
+    recipient = config.dest_inputs.get(recipient, recipient)
+    if reply_to is None:
+        reply_to = tm.reply_to
     if CONFIG.show_forwarded_from:
-        return await client.forward_messages(recipient, tm.message)
+        try:
+            async with SEND_SEM:
+                return await _retry(client.forward_messages, recipient, tm.message)
+        except ChatForwardsRestrictedError:
+            logging.warning(
+                "Chat %s has protected content. Sending a copy.", tm.message.chat_id
+            )
     if tm.new_file:
-        message = await client.send_file(
-            recipient, tm.new_file, caption=tm.text, reply_to=tm.reply_to
-        )
+        if tm.uploaded_file is None:
+            # upload the file only once; concurrent sends to the other
+            # destinations await the same task and reuse its handle.
+            # 512 KB is the largest part size Telegram accepts, so large
+            # files need the fewest round trips
+            tm.uploaded_file = asyncio.ensure_future(
+                _retry(client.upload_file, tm.new_file, part_size_kb=512)
+            )
+        uploaded_file = await tm.uploaded_file
+        async with SEND_SEM:
+            message = await _retry(
+                client.send_file,
+                recipient,
+                uploaded_file,
+                caption=tm.text,
+                reply_to=reply_to,
+            )
         return message
     tm.message.text = tm.text
-    return await client.send_message(recipient, tm.message, reply_to=tm.reply_to)
+    async with SEND_SEM:
+        return await _retry(
+            client.send_message, recipient, tm.message, reply_to=reply_to
+        )
+
+
+async def send_album(
+    recipient: EntityLike,
+    client: TelegramClient,
+    messages: List[Message],
+    media: List,
+    captions: List[str],
+) -> List[Message]:
+    """Forward or send a copy of a whole album as one grouped message.
+
+    The media and caption lists are built once by the caller, not per
+    destination, and carry the plugin output for every item.
+    """
+    recipient = config.dest_inputs.get(recipient, recipient)
+    if CONFIG.show_forwarded_from:
+        try:
+            async with SEND_SEM:
+                return await _retry(client.forward_messages, recipient, messages)
+        except ChatForwardsRestrictedError:
+            logging.warning(
+                "Chat %s has protected content. Sending a copy.",
+                messages[0].chat_id,
+            )
+    async with SEND_SEM:
+        return await _retry(client.send_file, recipient, media, caption=captions)
 
 
 def cleanup(*files: str) -> None: